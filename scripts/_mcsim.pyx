@@ -0,0 +1,88 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Native tick loop for monte_carlo_simulation.py (the ``cython`` backend).
+
+Build in place with ``cythonize -i scripts/_mcsim.pyx``. When the extension
+is not built the simulation script falls back to its NumPy backend.
+
+Each game gets its own xoshiro256++ stream derived from ``seed`` and the
+game index, so a game's trajectory does not depend on the rest of the batch.
+Consecutive groups of ``replicas`` games share a stream (common random
+numbers).
+"""
+
+from libc.stdint cimport int16_t, int32_t, uint64_t
+
+cdef inline uint64_t _rotl(uint64_t x, int k) noexcept nogil:
+    return (x << k) | (x >> (64 - k))
+
+cdef inline uint64_t _splitmix64(uint64_t* state) noexcept nogil:
+    state[0] += 0x9E3779B97F4A7C15ULL
+    cdef uint64_t z = state[0]
+    z = (z ^ (z >> 30)) * 0xBF58476D1CE4E5B9ULL
+    z = (z ^ (z >> 27)) * 0x94D049BB133111EBULL
+    return z ^ (z >> 31)
+
+cdef inline uint64_t _xoshiro256pp(uint64_t* s) noexcept nogil:
+    cdef uint64_t result = _rotl(s[0] + s[3], 23) + s[0]
+    cdef uint64_t t = s[1] << 17
+    s[2] ^= s[0]
+    s[3] ^= s[1]
+    s[1] ^= s[2]
+    s[0] ^= s[3]
+    s[2] ^= t
+    s[3] = _rotl(s[3], 45)
+    return result
+
+cdef inline float _uniform32(uint64_t* s) noexcept nogil:
+    # Top 24 bits give every representable float32 step in [0, 1)
+    return <float>(_xoshiro256pp(s) >> 40) * (1.0 / 16777216.0)
+
+def simulate_batch(
+    const float[:, ::1] inv_skill_factor,
+    const float[::1] tick_chances,
+    uint64_t seed,
+    int16_t[:, ::1] death_ticks,
+    int32_t[::1] duration_ticks,
+    Py_ssize_t replicas=1,
+):
+    """
+    Simulate ``inv_skill_factor.shape[0]`` games, writing results in place.
+
+    ``tick_chances[t]`` is the base collision chance at tick ``t`` (index 0
+    unused) and its length sets the game length. ``death_ticks`` receives the
+    elimination tick of each player (-1 = survived) and ``duration_ticks``
+    the number of ticks each game ran.
+    """
+    cdef Py_ssize_t num_games = inv_skill_factor.shape[0]
+    cdef Py_ssize_t num_players = inv_skill_factor.shape[1]
+    cdef int max_ticks = <int>tick_chances.shape[0] - 1
+    cdef Py_ssize_t g, p
+    cdef int tick, alive_count, killed
+    cdef float chance
+    cdef uint64_t sm
+    cdef uint64_t s[4]
+
+    with nogil:
+        for g in range(num_games):
+            sm = seed ^ (<uint64_t>(g // replicas) * 0xD1B54A32D192ED03ULL)
+            s[0] = _splitmix64(&sm)
+            s[1] = _splitmix64(&sm)
+            s[2] = _splitmix64(&sm)
+            s[3] = _splitmix64(&sm)
+
+            for p in range(num_players):
+                death_ticks[g, p] = -1
+
+            alive_count = <int>num_players
+            tick = 0
+            while alive_count > 1 and tick < max_ticks:
+                tick += 1
+                chance = tick_chances[tick] * alive_count / num_players
+                killed = 0
+                for p in range(num_players):
+                    if death_ticks[g, p] < 0 and _uniform32(s) < chance * inv_skill_factor[g, p]:
+                        death_ticks[g, p] = <int16_t>tick
+                        killed += 1
+                alive_count -= killed
+            duration_ticks[g] = tick
@@ -11,12 +11,39 @@ This script simulates thousands of games to analyze:
 5. Skill vs luck ratio
 """
 
-import random
 import numpy as np
 from dataclasses import dataclass
-from typing import List, Dict, Tuple
-from collections import defaultdict
+from typing import List, Dict, Optional, Sequence, Tuple
+from multiprocessing import Pool
+import multiprocessing.pool
 import json
+import os
+import warnings
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # Numba backend is optional
+    NUMBA_AVAILABLE = False
+
+try:
+    from numba import cuda
+    from numba.cuda.random import create_xoroshiro128p_states, xoroshiro128p_uniform_float32
+    NUMBA_CUDA_AVAILABLE = True
+except ImportError:  # CUDA backend is optional
+    NUMBA_CUDA_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:  # Falls back to the json module
+    ORJSON_AVAILABLE = False
+
+try:
+    from _mcsim import simulate_batch  # Built with: cythonize -i scripts/_mcsim.pyx
+    CYTHON_AVAILABLE = True
+except ImportError:  # Cython backend is optional
+    CYTHON_AVAILABLE = False
 
 # Game mode configurations (matching server)
 GAME_MODES = {
@@ -34,27 +61,80 @@ PAYOUTS = {
     10: [(1, 0.694), (2, 0.208), (3, 0.098)],  # Arena: Top 3
 }
 
-@dataclass
-class Player:
-    id: int
-    skill: float  # 0.0 to 1.0, affects survival probability
-    position: Tuple[int, int]
-    alive: bool = True
+MAX_TICKS = 3000  # ~2.5 minutes at 20Hz
+BASE_COLLISION_CHANCE = 0.005  # Base chance per tick per player
+
+def build_tick_factors(max_ticks: int = MAX_TICKS) -> np.ndarray:
+    """
+    Per-tick ``speed_multiplier * arena_factor`` table, indexed by tick.
     
+    Index 0 is unused since the first simulated tick is 1. The factors are the
+    same for every game, so they are computed once instead of inside tick loops.
+    """
+    ticks = np.arange(max_ticks + 1)
+    # Speed increases every 100 ticks (5 seconds at 20Hz), matching server
+    speed_multiplier = np.minimum(2.5, 1.0 + 0.15 * (ticks // 100))
+    # Arena shrink increases danger
+    arena_factor = 1.0 + (ticks / max_ticks) * 2.0
+    return speed_multiplier * arena_factor
+
+TICK_FACTORS = build_tick_factors()
+# Probabilities are all in [0, 1], so float32 is plenty and halves traffic
+TICK_CHANCES = (BASE_COLLISION_CHANCE * TICK_FACTORS).astype(np.float32)
+
+# Batched simulation tile size. Each game row costs roughly
+# inv_skill + chance + draws (4 bytes each) + death_tick (2 bytes)
+# + still_in/killed masks (1 byte each) per player.
+TILE_BYTES = 256 * 1024
+TILE_BYTES_PER_PLAYER = 16
+# How often (in ticks) a tile checks whether to drop its finished games
+COMPACT_INTERVAL = 32
+
+def build_hazard_tables(terms: int = 4) -> np.ndarray:
+    """
+    Cumulative sums of ``q[t] ** k`` for k = 1..terms, where ``q`` is the base
+    per-tick collision chance. Shape ``(MAX_TICKS + 1, terms)``.
+    
+    A player with collision multiplier ``a`` has per-tick chance ``a * q[t]``,
+    so the cumulative hazard ``-sum(log(1 - a * q[t]))`` over ticks
+    ``(t0, t]`` is ``sum_k a**k / k * (table[t, k-1] - table[t0, k-1])``. With
+    ``a * q`` at most ~0.125, four series terms are accurate to ~1e-5.
+    """
+    q = BASE_COLLISION_CHANCE * TICK_FACTORS
+    q[0] = 0.0  # Tick 0 is never simulated
+    return np.cumsum(q[:, None] ** np.arange(1, terms + 1), axis=0)
+
+HAZARD_TABLES = build_hazard_tables()
+# Games sampled per chunk by the inverse-CDF simulator
+EVENT_TILE_GAMES = 8192
+# Games per seeded shard; fixed so a seed gives the same results on any
+# machine, and as large as the biggest (duel) tile so every shard fills at
+# least one full tile in every mode
+SHARD_GAMES = TILE_BYTES // (2 * TILE_BYTES_PER_PLAYER)
+
 @dataclass
 class GameResult:
     mode: str
     rankings: List[int]  # Player IDs in finish order
     duration_ticks: int
 
-def simulate_player_skill() -> float:
-    """Generate random skill level with slight bias towards average."""
-    return min(1.0, max(0.0, random.gauss(0.5, 0.2)))
+@dataclass
+class BatchResult:
+    mode: str
+    death_ticks: np.ndarray  # (games, players) tick of elimination, -1 = survived
+    duration_ticks: np.ndarray  # (games,)
 
-def simulate_game(mode: str, player_skills: List[float] = None) -> GameResult:
+def simulate_game(
+    mode: str,
+    player_skills: List[float] = None,
+    rng: Optional[np.random.Generator] = None
+) -> GameResult:
     """
     Simulate a single game with given mode.
     
+    Scalar reference implementation kept for debugging; Monte Carlo runs use
+    the batched ``simulate_games``.
+    
     The simulation models:
     - Collision probability based on arena density
     - Skill affects reaction time and decision quality
@@ -65,67 +145,54 @@ def simulate_game(mode: str, player_skills: List[float] = None) -> GameResult:
     num_players = config["players"]
     grid_size = config["grid"]
     
-    # Create players with skills
+    if rng is None:
+        rng = np.random.default_rng()
+    
+    # Create players with skills (slight bias towards average)
     if player_skills is None:
-        player_skills = [simulate_player_skill() for _ in range(num_players)]
+        player_skills = np.clip(rng.normal(0.5, 0.2, num_players), 0.0, 1.0).tolist()
     
-    players = [
-        Player(id=i, skill=player_skills[i], position=(0, 0))
-        for i in range(num_players)
-    ]
+    skills = np.array(player_skills, dtype=np.float32)
+    alive = np.ones(num_players, dtype=bool)
+    death_ticks = np.full(num_players, -1, dtype=np.int32)
+    
+    # Collision probability formula:
+    # Base chance * speed * arena_shrink * density / skill
+    # Higher skill = lower collision chance
+    skill_factor = 0.3 + (skills * 0.7)  # Skill reduces risk by up to 70%
     
-    rankings = []
     tick = 0
-    max_ticks = 3000  # ~2.5 minutes at 20Hz
+    max_ticks = MAX_TICKS
+    
+    # Progressive game speed and arena shrink (matching server implementation)
+    base_collision_chance = BASE_COLLISION_CHANCE
+    tick_factors = TICK_FACTORS
     
-    # Progressive game speed (matching server implementation)
-    base_collision_chance = 0.005  # Base chance per tick per player
-    speed_multiplier = 1.0
+    # Running count of alive players, updated on each elimination
+    alive_count = num_players
     
-    while len([p for p in players if p.alive]) > 1 and tick < max_ticks:
+    while alive_count > 1 and tick < max_ticks:
         tick += 1
         
-        # Speed increases every 100 ticks (5 seconds at 20Hz)
-        if tick % 100 == 0:
-            speed_multiplier = min(2.5, speed_multiplier + 0.15)
-        
-        # Arena shrink increases danger
-        arena_factor = 1.0 + (tick / max_ticks) * 2.0
-        
         # Calculate density (more players = more danger)
-        alive_count = len([p for p in players if p.alive])
         density_factor = alive_count / num_players
         
-        for player in players:
-            if not player.alive:
-                continue
-            
-            # Collision probability formula:
-            # Base chance * speed * arena_shrink * density / skill
-            # Higher skill = lower collision chance
-            skill_factor = 0.3 + (player.skill * 0.7)  # Skill reduces risk by up to 70%
-            
-            collision_chance = (
-                base_collision_chance 
-                * speed_multiplier 
-                * arena_factor 
-                * density_factor 
-                / skill_factor
-            )
-            
-            # Check if player collides this tick
-            if random.random() < collision_chance:
-                player.alive = False
-                rankings.append(player.id)
-    
-    # Add remaining players (winners) to rankings
-    alive_players = [p for p in players if p.alive]
-    random.shuffle(alive_players)  # Randomize final placement if multiple survive
-    for p in alive_players:
-        rankings.append(p.id)
-    
-    # Reverse rankings (first to die = last place)
-    rankings.reverse()
+        collision_chance = (
+            base_collision_chance 
+            * tick_factors[tick] 
+            * density_factor 
+            / skill_factor
+        )
+        
+        # Check which players collide this tick
+        killed = alive & (rng.random(num_players) < collision_chance)
+        if killed.any():
+            alive &= ~killed
+            death_ticks[killed] = tick
+            alive_count -= int(np.count_nonzero(killed))
+    
+    # First to die = last place; multiple survivors are placed randomly
+    rankings = finishing_order(death_ticks[None, :], rng)[0].tolist()
     
     return GameResult(mode=mode, rankings=rankings, duration_ticks=tick)
 
@@ -143,57 +210,558 @@ def calculate_ev(mode: str, player_rank: int) -> float:
     
     return -entry_fee  # Lost
 
+def payout_vector(mode: str) -> np.ndarray:
+    """Profit/loss indexed by finishing rank, so ``payout_vector(mode)[ranks]`` maps a rank array."""
+    num_players = GAME_MODES[mode]["players"]
+    # Index 0 is never a valid rank; it just keeps ranks usable as indices
+    return np.array([calculate_ev(mode, rank) for rank in range(num_players + 1)])
+
+def _inv_skill_factor(skills: np.ndarray) -> np.ndarray:
+    """Per-player collision multiplier; skill reduces risk by up to 70%."""
+    return (1.0 / (0.3 + (skills * 0.7))).astype(np.float32)
+
+def _simulate_tile(
+    inv_skill_factor: np.ndarray,
+    tick_chances: np.ndarray,
+    death_ticks: np.ndarray,
+    duration_ticks: np.ndarray,
+    rng: np.random.Generator,
+    replicas: int = 1
+) -> None:
+    """
+    Run every tick for one tile of games, filling ``death_ticks`` and ``duration_ticks`` in place.
+    
+    Rows come in consecutive groups of ``replicas`` that consume the same
+    random draws (common random numbers). Every ``COMPACT_INTERVAL`` ticks, if
+    fewer than half of the groups still being simulated are active, finished
+    groups are written back and dropped so later ticks only touch live rows.
+    """
+    num_games, num_players = inv_skill_factor.shape
+    still_in_buf = np.empty((num_games, num_players), dtype=bool)
+    killed_buf = np.empty((num_games, num_players), dtype=bool)
+    chance_buf = np.empty((num_games, num_players), dtype=np.float32)
+    draws_buf = np.empty((num_games // replicas, num_players), dtype=np.float32)
+    
+    # Working copies of the games still being simulated
+    rows = np.arange(num_games)
+    inv_skill = inv_skill_factor
+    deaths = death_ticks.copy()
+    durations = duration_ticks.copy()
+    
+    for tick in range(1, MAX_TICKS + 1):
+        n = len(rows)
+        still_in, killed = still_in_buf[:n], killed_buf[:n]
+        collision_chance, draws = chance_buf[:n], draws_buf[:n // replicas]
+        
+        # Death ticks are the only per-player state; a player is alive while < 0
+        np.less(deaths, 0, out=still_in)
+        alive_count = still_in.sum(axis=1)
+        active = alive_count > 1
+        
+        if tick % COMPACT_INTERVAL == 0:
+            group_active = active.reshape(-1, replicas).any(axis=1)
+            num_active = int(np.count_nonzero(group_active))
+            if num_active < len(group_active) // 2:
+                keep = np.repeat(group_active, replicas)
+                done = ~keep
+                death_ticks[rows[done]] = deaths[done]
+                duration_ticks[rows[done]] = durations[done]
+                rows, inv_skill = rows[keep], inv_skill[keep]
+                deaths, durations = deaths[keep], durations[keep]
+                alive_count, active = alive_count[keep], active[keep]
+                n = num_active * replicas
+                still_in, killed = still_in_buf[:n], killed_buf[:n]
+                collision_chance, draws = chance_buf[:n], draws_buf[:num_active]
+                np.less(deaths, 0, out=still_in)
+        
+        if not active.any():
+            break
+        durations += active
+        
+        density_factor = alive_count.astype(np.float32) / num_players
+        np.multiply(inv_skill, (tick_chances[tick] * density_factor)[:, None], out=collision_chance)
+        
+        # One draw per player per group, broadcast across the group's replicas
+        rng.random(dtype=np.float32, out=draws)
+        np.less(
+            draws[:, None, :],
+            collision_chance.reshape(-1, replicas, num_players),
+            out=killed.reshape(-1, replicas, num_players),
+        )
+        # Finished games stop ticking, so their last player cannot be killed
+        killed &= still_in
+        killed &= active[:, None]
+        np.copyto(deaths, tick, where=killed)
+    
+    death_ticks[rows] = deaths
+    duration_ticks[rows] = durations
+
+def simulate_games(
+    mode: str,
+    skills: np.ndarray,
+    rng: np.random.Generator,
+    replicas: int = 1
+) -> BatchResult:
+    """
+    Simulate a batch of games of the given mode in lockstep.
+    
+    Each row of ``skills`` is one game, each column one player. Uses the same
+    collision model as ``simulate_game`` but advances every game one tick at
+    a time with vectorized NumPy operations instead of per-player Python loops.
+    Games are processed in tiles of ``TILE_BYTES`` so the per-tick working set
+    stays cache resident across the whole tick loop. With ``replicas > 1``,
+    each consecutive group of that many rows shares one random stream.
+    """
+    config = GAME_MODES[mode]
+    num_players = config["players"]
+    num_games = skills.shape[0]
+    
+    inv_skill_factor = _inv_skill_factor(skills)
+    death_ticks = np.full((num_games, num_players), -1, dtype=np.int16)  # MAX_TICKS fits
+    duration_ticks = np.zeros(num_games, dtype=np.int32)
+    
+    # Tiles are small enough for L2 but large enough to amortize NumPy call
+    # overhead, and never split a replica group
+    tile_groups = max(1, TILE_BYTES // (num_players * TILE_BYTES_PER_PLAYER * replicas))
+    tile_games = tile_groups * replicas
+    for start in range(0, num_games, tile_games):
+        tile = slice(start, start + tile_games)
+        _simulate_tile(
+            inv_skill_factor[tile], TICK_CHANCES, death_ticks[tile], duration_ticks[tile], rng, replicas
+        )
+    
+    return BatchResult(mode=mode, death_ticks=death_ticks, duration_ticks=duration_ticks)
+
+def make_numba_kernel(num_players: int):
+    """
+    Build a Numba tick-loop kernel specialized for ``num_players``.
+    
+    The player count is a closed-over compile-time constant, so Numba can
+    unroll the per-player loop and fold the density divisor.
+    """
+    inv_num_players = 1.0 / num_players
+    
+    @njit(parallel=True, fastmath=True, cache=True)
+    def simulate_games_nb(skills, seeds, base_p, tick_factors, out_death_ticks, out_durations):
+        """
+        Scalar tick loop per game compiled with Numba, parallel over games.
+        
+        ``tick_factors`` comes from ``build_tick_factors`` and sets the game
+        length. ``out_death_ticks`` must be pre-filled with -1. Each game reseeds
+        Numba's per-thread RNG from ``seeds`` so results do not depend on
+        how games are scheduled across threads.
+        """
+        num_games = skills.shape[0]
+        max_ticks = tick_factors.shape[0] - 1
+        for g in prange(num_games):
+            np.random.seed(seeds[g])
+            alive_count = num_players
+            tick = 0
+            while alive_count > 1 and tick < max_ticks:
+                tick += 1
+                density_factor = alive_count * inv_num_players
+                tick_chance = base_p * tick_factors[tick] * density_factor
+                
+                killed = 0
+                for p in range(num_players):
+                    if out_death_ticks[g, p] >= 0:
+                        continue
+                    skill_factor = 0.3 + (skills[g, p] * 0.7)
+                    if np.random.random() < tick_chance / skill_factor:
+                        out_death_ticks[g, p] = tick
+                        killed += 1
+                alive_count -= killed
+            out_durations[g] = tick
+    
+    return simulate_games_nb
+
+# One specialized kernel per game mode (compiled lazily on first call)
+_NUMBA_KERNELS = (
+    {mode: make_numba_kernel(config["players"]) for mode, config in GAME_MODES.items()}
+    if NUMBA_AVAILABLE else {}
+)
+
+def simulate_games_numba(
+    mode: str,
+    skills: np.ndarray,
+    rng: np.random.Generator,
+    replicas: int = 1
+) -> BatchResult:
+    """
+    Numba-compiled alternative to ``simulate_games``.
+    
+    Runs each game's tick loop to completion independently, so finished games
+    cost nothing, at the price of using Numba's own RNG seeded from ``rng``.
+    Replica groups share a seed and therefore a random stream.
+    """
+    if not NUMBA_AVAILABLE:
+        raise ImportError("The 'numba' backend requires numba to be installed")
+    
+    num_games, num_players = skills.shape
+    seeds = rng.integers(0, 2**32, size=num_games // replicas, dtype=np.uint32)
+    seeds = np.repeat(seeds, replicas)
+    death_ticks = np.full((num_games, num_players), -1, dtype=np.int16)
+    duration_ticks = np.zeros(num_games, dtype=np.int32)
+    _NUMBA_KERNELS[mode](
+        np.ascontiguousarray(skills, dtype=np.float64), seeds,
+        BASE_COLLISION_CHANCE, TICK_FACTORS, death_ticks, duration_ticks
+    )
+    return BatchResult(mode=mode, death_ticks=death_ticks, duration_ticks=duration_ticks)
+
+if NUMBA_CUDA_AVAILABLE:
+    @cuda.jit
+    def mc_kernel(inv_skill_factor, tick_chances, death_ticks, duration_ticks, rng_states):
+        """One CUDA thread per game; ticks stay in lockstep within a warp."""
+        g = cuda.grid(1)
+        if g >= inv_skill_factor.shape[0]:
+            return
+        num_players = inv_skill_factor.shape[1]
+        max_ticks = tick_chances.shape[0] - 1
+        
+        for p in range(num_players):
+            death_ticks[g, p] = -1
+        
+        alive_count = num_players
+        tick = 0
+        while alive_count > 1 and tick < max_ticks:
+            tick += 1
+            chance = tick_chances[tick] * alive_count / num_players
+            killed = 0
+            for p in range(num_players):
+                if death_ticks[g, p] < 0:
+                    if xoroshiro128p_uniform_float32(rng_states, g) < chance * inv_skill_factor[g, p]:
+                        death_ticks[g, p] = tick
+                        killed += 1
+            alive_count -= killed
+        duration_ticks[g] = tick
+
+def simulate_games_cuda(
+    mode: str,
+    skills: np.ndarray,
+    rng: np.random.Generator,
+    replicas: int = 1
+) -> BatchResult:
+    """
+    GPU alternative to ``simulate_games`` using Numba CUDA.
+    
+    Each thread simulates one game with its own xoroshiro128+ stream; replica
+    groups start from copies of the same state. Falls back to the NumPy
+    backend with a warning when no CUDA device is present.
+    """
+    if not NUMBA_CUDA_AVAILABLE:
+        raise ImportError("The 'cuda' backend requires numba with CUDA support")
+    if not cuda.is_available():
+        warnings.warn("No CUDA device available, using the NumPy backend instead")
+        return simulate_games(mode, skills, rng, replicas)
+    
+    num_games, num_players = skills.shape
+    threads_per_block = 256
+    blocks = (num_games + threads_per_block - 1) // threads_per_block
+    rng_states = create_xoroshiro128p_states(num_games // replicas, seed=int(rng.integers(0, 2**63)))
+    if replicas > 1:
+        rng_states = cuda.to_device(np.repeat(rng_states.copy_to_host(), replicas))
+    
+    d_death_ticks = cuda.device_array((num_games, num_players), dtype=np.int16)
+    d_duration_ticks = cuda.device_array(num_games, dtype=np.int32)
+    mc_kernel[blocks, threads_per_block](
+        cuda.to_device(_inv_skill_factor(skills)), cuda.to_device(TICK_CHANCES),
+        d_death_ticks, d_duration_ticks, rng_states
+    )
+    return BatchResult(
+        mode=mode,
+        death_ticks=d_death_ticks.copy_to_host(),
+        duration_ticks=d_duration_ticks.copy_to_host(),
+    )
+
+def simulate_games_cython(
+    mode: str,
+    skills: np.ndarray,
+    rng: np.random.Generator,
+    replicas: int = 1
+) -> BatchResult:
+    """
+    Native alternative to ``simulate_games`` backed by the ``_mcsim`` extension.
+    
+    Runs each game to completion in C with a per-game xoshiro256++ stream
+    seeded from ``rng``, shared within each replica group.
+    """
+    if not CYTHON_AVAILABLE:
+        raise ImportError("The 'cython' backend requires building scripts/_mcsim.pyx")
+    
+    num_games, num_players = skills.shape
+    death_ticks = np.empty((num_games, num_players), dtype=np.int16)
+    duration_ticks = np.empty(num_games, dtype=np.int32)
+    seed = int(rng.integers(0, 2**63))
+    simulate_batch(_inv_skill_factor(skills), TICK_CHANCES, seed, death_ticks, duration_ticks, replicas)
+    return BatchResult(mode=mode, death_ticks=death_ticks, duration_ticks=duration_ticks)
+
+def _sample_death_ticks(
+    inv_skill_factor: np.ndarray,
+    death_ticks: np.ndarray,
+    duration_ticks: np.ndarray,
+    rng: np.random.Generator,
+    replicas: int = 1
+) -> None:
+    """Event-driven simulation of one chunk of games, filling outputs in place."""
+    num_games, num_players = inv_skill_factor.shape
+    powers = np.arange(1, HAZARD_TABLES.shape[1] + 1)
+    clock = np.zeros(num_games, dtype=np.intp)  # Tick of the last elimination
+    
+    # Every round eliminates at least one player per active game
+    for _ in range(num_players - 1):
+        still_in = death_ticks < 0
+        alive_count = still_in.sum(axis=1)
+        games = np.flatnonzero((alive_count > 1) & (clock < MAX_TICKS))
+        if len(games) == 0:
+            break
+        
+        # Exp(1) thresholds, shared within replica groups
+        thresholds = np.repeat(
+            rng.standard_exponential((num_games // replicas, num_players)), replicas, axis=0
+        )[games]
+        
+        # The density factor is fixed until the next elimination
+        rate = inv_skill_factor[games] * (alive_count[games] / num_players)[:, None]
+        coeffs = rate[:, :, None] ** powers / powers
+        start = clock[games]
+        base = HAZARD_TABLES[start][:, None, :]
+        
+        # -log(1 - x) lies between x and x / (1 - x_max), so two searches on
+        # the first-order table bracket the exact crossing tick
+        first_order = HAZARD_TABLES[:, 0]
+        offset = first_order[start][:, None]
+        hi = np.searchsorted(first_order, offset + thresholds / rate)
+        # Chances only grow with the tick, so the one at ``hi`` is the largest in the bracket
+        max_chance = rate * TICK_CHANCES[np.minimum(hi, MAX_TICKS)]
+        lo = np.searchsorted(first_order, offset + thresholds * (1.0 - max_chance) / rate) - 1
+        lo = np.maximum(lo, start[:, None])
+        
+        # Binary search inside the bracket for the first tick whose cumulative
+        # hazard crosses the threshold; MAX_TICKS + 1 means the player outlasts the game
+        while (hi - lo > 1).any():
+            mid = (lo + hi) // 2
+            hazard = (coeffs * (HAZARD_TABLES[np.minimum(mid, MAX_TICKS)] - base)).sum(axis=2)
+            crossed = hazard >= thresholds
+            hi = np.where(crossed, mid, hi)
+            lo = np.where(crossed, lo, mid)
+        
+        next_death = np.where(still_in[games], hi, MAX_TICKS + 1)
+        first_death = next_death.min(axis=1)
+        # Everyone whose death falls on the earliest tick dies together
+        dying = (next_death == first_death[:, None]) & (first_death <= MAX_TICKS)[:, None]
+        rows, players = np.nonzero(dying)
+        death_ticks[games[rows], players] = first_death[rows]
+        clock[games] = np.minimum(first_death, MAX_TICKS)
+        
+        finished = (alive_count[games] - dying.sum(axis=1) <= 1) & (first_death <= MAX_TICKS)
+        duration_ticks[games[finished]] = first_death[finished]
+
+def simulate_games_inverse_cdf(
+    mode: str,
+    skills: np.ndarray,
+    rng: np.random.Generator,
+    replicas: int = 1
+) -> BatchResult:
+    """
+    Event-driven alternative to ``simulate_games`` that samples death ticks directly.
+    
+    Between eliminations the density factor is constant, so each alive
+    player's next death tick is drawn by inverting its survival function
+    against an Exp(1) threshold, using ``HAZARD_TABLES``. A game then costs at
+    most ``players - 1`` rounds instead of one step per tick. Simultaneous
+    deaths are kept, so rankings match the tick simulator's distribution.
+    """
+    num_games, num_players = skills.shape
+    inv_skill_factor = _inv_skill_factor(skills)
+    death_ticks = np.full((num_games, num_players), -1, dtype=np.int16)
+    duration_ticks = np.full(num_games, MAX_TICKS, dtype=np.int32)
+    
+    tile_games = max(1, EVENT_TILE_GAMES // replicas) * replicas
+    for start in range(0, num_games, tile_games):
+        tile = slice(start, start + tile_games)
+        _sample_death_ticks(inv_skill_factor[tile], death_ticks[tile], duration_ticks[tile], rng, replicas)
+    
+    return BatchResult(mode=mode, death_ticks=death_ticks, duration_ticks=duration_ticks)
+
+# Batch simulators selectable via ``run_monte_carlo(backend=...)``
+SIMULATORS = {
+    "numpy": simulate_games,
+    "numba": simulate_games_numba,
+    "cython": simulate_games_cython,
+    "cuda": simulate_games_cuda,
+    "inverse_cdf": simulate_games_inverse_cdf,
+}
+
+def _finish_keys(
+    death_ticks: np.ndarray,
+    rng: np.random.Generator,
+    replicas: int = 1
+) -> np.ndarray:
+    """
+    Sort keys for finish order from death ticks (-1 = survived).
+    
+    Later deaths rank higher; survivors outrank everyone and ties (including
+    multiple survivors) are broken randomly, with the same tiebreak noise for
+    every game in a replica group.
+    """
+    num_games, num_players = death_ticks.shape
+    finish_key = np.where(death_ticks < 0, MAX_TICKS + 1, death_ticks).astype(np.float64)
+    finish_key += np.repeat(rng.random((num_games // replicas, num_players)), replicas, axis=0)
+    return finish_key
+
+def finishing_order(death_ticks: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Player IDs of each game sorted from winner to first eliminated."""
+    return np.argsort(-_finish_keys(death_ticks, rng), axis=1)
+
+def rank_players(death_ticks: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Rank every player from death ticks (-1 = survived), 1 = winner."""
+    order = finishing_order(death_ticks, rng)
+    ranks = np.empty_like(order)
+    np.put_along_axis(ranks, order, np.arange(1, order.shape[1] + 1), axis=1)
+    return ranks
+
+def player_ranks(
+    death_ticks: np.ndarray,
+    rng: np.random.Generator,
+    player: int = 0,
+    replicas: int = 1
+) -> np.ndarray:
+    """Rank of a single player in each game: 1 + number of players finishing ahead."""
+    finish_key = _finish_keys(death_ticks, rng, replicas)
+    return 1 + (finish_key > finish_key[:, player:player + 1]).sum(axis=1)
+
+def random_opponent_skills(
+    num_games: int,
+    num_players: int,
+    player_skills: Sequence[float],
+    rng: np.random.Generator
+) -> np.ndarray:
+    """
+    Skill matrix with our player (column 0) fixed and random opponents.
+    
+    Each set of opponents is repeated once per entry of ``player_skills``,
+    giving ``num_games * len(player_skills)`` rows in replica-group order.
+    """
+    opponents = np.clip(rng.normal(0.5, 0.2, (num_games, num_players)), 0.0, 1.0)
+    skills = np.repeat(opponents, len(player_skills), axis=0)
+    skills[:, 0] = np.tile(player_skills, num_games)
+    return skills
+
+def _mc_worker(
+    args: Tuple[int, str, Tuple[float, ...], int, np.random.SeedSequence, str]
+) -> Tuple[int, np.ndarray, np.ndarray]:
+    """
+    Simulate one shard of games; returns (shard offset, player 0 ranks, game durations).
+    
+    Both arrays have shape ``(num_games, len(player_skills))``: every game is
+    replayed with the same opponents and random numbers for each skill level.
+    """
+    offset, mode, player_skills, num_games, seed_seq, backend = args
+    rng = np.random.default_rng(seed_seq)
+    replicas = len(player_skills)
+    skills = random_opponent_skills(num_games, GAME_MODES[mode]["players"], player_skills, rng)
+    batch = SIMULATORS[backend](mode, skills, rng, replicas)
+    ranks = player_ranks(batch.death_ticks, rng, replicas=replicas)
+    return offset, ranks.reshape(num_games, replicas), batch.duration_ticks.reshape(num_games, replicas)
+
+def _run_shards(
+    mode: str,
+    player_skills: Tuple[float, ...],
+    num_games: int,
+    seed_seq: np.random.SeedSequence,
+    pool: Optional[multiprocessing.pool.Pool] = None,
+    backend: str = "numpy"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split ``num_games`` across worker processes and gather the results.
+    
+    Games are cut into ``SHARD_GAMES``-sized shards, each with its own child
+    seed, so results depend only on the seed and not on the worker count,
+    which worker runs a shard or in what order. Shards are streamed back from
+    the caller's long-lived pool with ``imap_unordered`` and written into place
+    as they arrive. Without a pool the same shards run in-process.
+    """
+    offsets = range(0, num_games, SHARD_GAMES)
+    shards = [
+        (offset, mode, player_skills, min(SHARD_GAMES, num_games - offset), child, backend)
+        for offset, child in zip(offsets, seed_seq.spawn(len(offsets)))
+    ]
+    if pool is not None:
+        # Each shard is thousands of games, so per-task IPC is negligible and
+        # handing out one shard at a time balances load best
+        parts = pool.imap_unordered(_mc_worker, shards, chunksize=1)
+    else:
+        parts = map(_mc_worker, shards)
+    
+    # Write each shard into preallocated outputs rather than growing lists
+    ranks = np.empty((num_games, len(player_skills)), dtype=np.intp)
+    durations = np.empty((num_games, len(player_skills)), dtype=np.int32)
+    for offset, shard_ranks, shard_durations in parts:
+        stop = offset + len(shard_ranks)
+        ranks[offset:stop] = shard_ranks
+        durations[offset:stop] = shard_durations
+    return ranks, durations
+
 def run_monte_carlo(
     num_simulations: int = 10000,
     mode: str = "ranked",
-    player_skill: float = 0.5
+    player_skill: float = 0.5,
+    seed: Optional[int] = None,
+    pool: Optional[multiprocessing.pool.Pool] = None,
+    backend: str = "numpy"
 ) -> Dict:
     """
     Run Monte Carlo simulation for expected value analysis.
     
+    Random draws come from PCG64 generators spawned from ``seed``; pass a
+    ``multiprocessing.Pool`` to shard the simulations across processes.
+    ``backend`` picks the batch simulator from ``SIMULATORS``.
     Returns comprehensive statistics about game fairness and player outcomes.
     """
     config = GAME_MODES[mode]
     num_players = config["players"]
+    main_seed, impact_seed = np.random.SeedSequence(seed).spawn(2)
     
     results = {
         "mode": mode,
         "simulations": num_simulations,
         "player_skill": player_skill,
         "config": config,
-        "rank_distribution": defaultdict(int),
+        "rank_distribution": {},
         "total_profit": 0.0,
-        "profits": [],
-        "game_durations": [],
+        "profits": None,
+        "game_durations": None,
     }
     
-    for _ in range(num_simulations):
-        # Simulate game with our player (ID 0) at specified skill level
-        skills = [player_skill] + [simulate_player_skill() for _ in range(num_players - 1)]
-        game = simulate_game(mode, skills)
-        
-        # Find our player's rank
-        player_rank = game.rankings.index(0) + 1
-        results["rank_distribution"][player_rank] += 1
-        
-        # Calculate profit/loss
-        ev = calculate_ev(mode, player_rank)
-        results["profits"].append(ev)
-        results["total_profit"] += ev
-        results["game_durations"].append(game.duration_ticks)
+    # Simulate all games at once with our player (ID 0) at specified skill level
+    ranks, durations = _run_shards(mode, (player_skill,), num_simulations, main_seed, pool, backend)
+    ranks, durations = ranks[:, 0], durations[:, 0]
+    
+    rank_counts = np.bincount(ranks, minlength=num_players + 1)
+    results["rank_distribution"] = {
+        rank: int(count) for rank, count in enumerate(rank_counts) if rank > 0 and count > 0
+    }
+    
+    # Calculate profit/loss for every game with one lookup
+    payout_vec = payout_vector(mode)
+    profits = np.empty(num_simulations)
+    np.take(payout_vec, ranks, out=profits)
+    results["profits"] = profits
+    results["total_profit"] = float(profits.sum())
+    results["game_durations"] = durations
     
     # Calculate statistics
-    profits = np.array(results["profits"])
+    avg_duration = float(np.mean(durations))
     results["statistics"] = {
         "expected_value": float(np.mean(profits)),
         "std_deviation": float(np.std(profits)),
         "median_profit": float(np.median(profits)),
         "min_profit": float(np.min(profits)),
         "max_profit": float(np.max(profits)),
-        "win_rate": sum(1 for p in profits if p > 0) / num_simulations * 100,
-        "break_even_rate": sum(1 for p in profits if p >= 0) / num_simulations * 100,
-        "avg_game_duration_ticks": float(np.mean(results["game_durations"])),
-        "avg_game_duration_seconds": float(np.mean(results["game_durations"])) / 20,  # 20Hz tick rate
+        "win_rate": int(np.count_nonzero(profits > 0)) / num_simulations * 100,
+        "break_even_rate": int(np.count_nonzero(profits >= 0)) / num_simulations * 100,
+        "avg_game_duration_ticks": avg_duration,
+        "avg_game_duration_seconds": avg_duration / 20,  # 20Hz tick rate
     }
     
     # House edge calculation
@@ -209,33 +777,58 @@ def run_monte_carlo(
     }
     
     # Skill impact analysis
-    # Run quick sims at different skill levels
+    # Run quick sims at different skill levels, replaying the same opponents
+    # and random numbers for each level (common random numbers) so the
+    # differences between levels are not swamped by sampling noise
+    test_skills = (0.2, 0.5, 0.8)
+    impact_ranks, _ = _run_shards(mode, test_skills, 1000, impact_seed, pool, backend)
     skill_impact = {}
-    for test_skill in [0.2, 0.5, 0.8]:
-        test_profits = []
-        for _ in range(1000):
-            skills = [test_skill] + [simulate_player_skill() for _ in range(num_players - 1)]
-            game = simulate_game(mode, skills)
-            player_rank = game.rankings.index(0) + 1
-            test_profits.append(calculate_ev(mode, player_rank))
+    for i, test_skill in enumerate(test_skills):
+        test_profits = payout_vec[impact_ranks[:, i]]
         skill_impact[f"skill_{test_skill}"] = {
             "expected_value": float(np.mean(test_profits)),
-            "win_rate": sum(1 for p in test_profits if p > 0) / 1000 * 100,
+            "win_rate": int(np.count_nonzero(test_profits > 0)) / 1000 * 100,
         }
     results["skill_impact_analysis"] = skill_impact
     
     return results
 
-def analyze_all_modes(num_simulations: int = 5000) -> Dict:
+def analyze_all_modes(
+    num_simulations: int = 5000,
+    pool: Optional[multiprocessing.pool.Pool] = None
+) -> Dict:
     """Analyze all game modes and compare fairness."""
     all_results = {}
     
     for mode in GAME_MODES.keys():
         print(f"Simulating {mode}...")
-        all_results[mode] = run_monte_carlo(num_simulations, mode, player_skill=0.5)
+        all_results[mode] = run_monte_carlo(num_simulations, mode, player_skill=0.5, pool=pool)
     
     return all_results
 
+def save_results(all_results: Dict, output_file: str):
+    """
+    Write all mode results as indented JSON.
+    
+    Uses orjson when installed, which serializes NumPy arrays natively;
+    otherwise falls back to the standard library encoder.
+    """
+    serializable_results = {}
+    for mode, data in all_results.items():
+        data_copy = data.copy()
+        # Keep only first 100 for file size (slices are views, not copies)
+        data_copy['profits'] = data_copy['profits'][:100]
+        data_copy['game_durations'] = data_copy['game_durations'][:100]
+        serializable_results[mode] = data_copy
+    
+    if ORJSON_AVAILABLE:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        with open(output_file, 'wb') as f:
+            f.write(orjson.dumps(serializable_results, option=options))
+    else:
+        with open(output_file, 'w') as f:
+            json.dump(serializable_results, f, indent=2, default=np.ndarray.tolist)
+
 def print_report(results: Dict):
     """Print formatted analysis report."""
     print("\n" + "="*60)
@@ -313,8 +906,9 @@ if __name__ == "__main__":
     print("Starting QRON Monte Carlo Simulation...")
     print("This will simulate thousands of games to analyze fairness.\n")
     
-    # Run comprehensive analysis
-    all_results = analyze_all_modes(num_simulations=5000)
+    # Run comprehensive analysis, sharding simulations across all CPU cores
+    with Pool(os.cpu_count()) as pool:
+        all_results = analyze_all_modes(num_simulations=5000, pool=pool)
     
     # Print reports for each mode
     for mode, results in all_results.items():
@@ -339,16 +933,7 @@ if __name__ == "__main__":
     
     # Save results to JSON
     output_file = "monte_carlo_results.json"
-    with open(output_file, 'w') as f:
-        # Convert defaultdict to regular dict for JSON serialization
-        serializable_results = {}
-        for mode, data in all_results.items():
-            data_copy = data.copy()
-            data_copy['rank_distribution'] = dict(data_copy['rank_distribution'])
-            data_copy['profits'] = data_copy['profits'][:100]  # Keep only first 100 for file size
-            data_copy['game_durations'] = data_copy['game_durations'][:100]
-            serializable_results[mode] = data_copy
-        json.dump(serializable_results, f, indent=2)
+    save_results(all_results, output_file)
     
     print(f"\nDetailed results saved to {output_file}")
     print("\n[DONE] Monte Carlo simulation complete!")